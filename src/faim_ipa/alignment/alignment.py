@@ -1,5 +1,4 @@
 from abc import ABC
-from copy import copy
 
 import numpy as np
 
@@ -37,35 +36,27 @@ class GridAlignment(AbstractAlignment):
     """
 
     def _align(self, tiles: list[Tile]) -> list[Tile]:
-        aligned_tiles = []
-
         tile_shape = tiles[0].shape
+        assert all(
+            tile.shape[-2:] == tile_shape[-2:] for tile in tiles
+        ), "All tiles must have the same YX shape."
+
+        n_tiles = len(tiles)
+        ys = np.fromiter(
+            (tile.position.y for tile in tiles), dtype=np.int64, count=n_tiles
+        )
+        xs = np.fromiter(
+            (tile.position.x for tile in tiles), dtype=np.int64, count=n_tiles
+        )
+        tile_height, tile_width = tile_shape[-2], tile_shape[-1]
+        grid_y = np.round(ys / tile_height).astype(np.int64)
+        grid_x = np.round(xs / tile_width).astype(np.int64)
 
-        grid_positions_y = set()
-        grid_positions_x = set()
-        tile_map = {}
-        for tile in tiles:
-            assert (
-                tile.shape[-2:] == tile_shape[-2:]
-            ), "All tiles must have the same YX shape."
-            y_pos = int(np.round(tile.position.y / tile_shape[-2]))
-            x_pos = int(np.round(tile.position.x / tile_shape[-1]))
-            if (y_pos, x_pos) in tile_map.keys():
-                tile_map[(y_pos, x_pos)].append(tile)
-            else:
-                tile_map[(y_pos, x_pos)] = [tile]
-            grid_positions_y.add(y_pos)
-            grid_positions_x.add(x_pos)
-
-        grid_positions_y = sorted(grid_positions_y)
-        grid_positions_x = sorted(grid_positions_x)
-        for y_pos in grid_positions_y:
-            for x_pos in grid_positions_x:
-                if (y_pos, x_pos) in tile_map.keys():
-                    for unaligned_tile in tile_map[(y_pos, x_pos)]:
-                        new_tile = copy(unaligned_tile)
-                        new_tile.position.y = y_pos * tile_shape[-2]
-                        new_tile.position.x = x_pos * tile_shape[-1]
-                        aligned_tiles.append(new_tile)
+        aligned_tiles = []
+        for i in np.lexsort((grid_x, grid_y)):
+            tile = tiles[i]
+            tile.position.y = int(grid_y[i]) * tile_height
+            tile.position.x = int(grid_x[i]) * tile_width
+            aligned_tiles.append(tile)
 
         return aligned_tiles
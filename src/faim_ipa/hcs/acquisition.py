@@ -86,7 +86,14 @@ class PlateAcquisition(ABC):
         """
         ome_channels = []
         ch_metadata = self.get_channel_metadata()
-        max_channel = max(list(ch_metadata.keys()))
+        max_channel = max(ch_metadata)
+        info = np.iinfo(np.uint16)
+        window = {
+            "min": int(info.min),
+            "max": int(info.max),
+            "start": int(info.min),
+            "end": int(info.max),
+        }
         for index in range(max_channel + 1):
             if index in ch_metadata.keys():
                 metadata = ch_metadata[index]
@@ -99,12 +106,7 @@ class PlateAcquisition(ABC):
                         "inverted": False,
                         "label": metadata.channel_name,
                         "wavelength_id": f"C{str(metadata.channel_index + 1).zfill(2)}",
-                        "window": {
-                            "min": np.iinfo(np.uint16).min,
-                            "max": np.iinfo(np.uint16).max,
-                            "start": np.iinfo(np.uint16).min,
-                            "end": np.iinfo(np.uint16).max,
-                        },
+                        "window": window.copy(),
                     }
                 )
             else:
@@ -117,12 +119,7 @@ class PlateAcquisition(ABC):
                         "inverted": False,
                         "label": "empty",
                         "wavelength_id": f"C{str(index + 1).zfill(2)}",
-                        "window": {
-                            "min": np.iinfo(np.uint16).min,
-                            "max": np.iinfo(np.uint16).max,
-                            "start": np.iinfo(np.uint16).min,
-                            "end": np.iinfo(np.uint16).max,
-                        },
+                        "window": window.copy(),
                     }
                 )
 
@@ -192,7 +189,7 @@ class WellAcquisition(ABC):
             type
         """
         if self._dtype is None:
-            self._dtype = self._tiles[0].load_data().dtype
+            self._dtype = self._tiles[0].get_dtype()
 
         return self._dtype
 
@@ -264,9 +261,12 @@ class WellAcquisition(ABC):
         -------
             List of coordinate transformations.
         """
+        z_spacing = self.get_z_spacing()
+        yx_spacing = self.get_yx_spacing()
         transformations = []
         for s in range(max_layer + 1):
-            if self.get_z_spacing() is not None:
+            binning = yx_binning * 2**s
+            if z_spacing is not None:
                 transformations.append(
                     [
                         {
@@ -275,9 +275,9 @@ class WellAcquisition(ABC):
                             ]
                             * (ndim - 3)
                             + [
-                                float(self.get_z_spacing()),
-                                float(self.get_yx_spacing()[0] * yx_binning * 2**s),
-                                float(self.get_yx_spacing()[1] * yx_binning * 2**s),
+                                float(z_spacing),
+                                float(yx_spacing[0] * binning),
+                                float(yx_spacing[1] * binning),
                             ],
                             "type": "scale",
                         }
@@ -292,8 +292,8 @@ class WellAcquisition(ABC):
                             ]
                             * (ndim - 2)
                             + [
-                                float(self.get_yx_spacing()[0] * yx_binning * 2**s),
-                                float(self.get_yx_spacing()[1] * yx_binning * 2**s),
+                                float(yx_spacing[0] * binning),
+                                float(yx_spacing[1] * binning),
                             ],
                             "type": "scale",
                         }
@@ -307,12 +307,15 @@ class WellAcquisition(ABC):
         Compute the theoretical shape of the stitched well image.
         """
         if self._shape is None:
-            tile_extents = []
-            for tile in self._tiles:
-                tile_extents.append(
-                    tile.get_position()
-                    + np.array((1,) * (5 - len(tile.shape)) + tile.shape)
-                )
-            self._shape = tuple(np.max(tile_extents, axis=0))
+            positions = np.fromiter(
+                (c for tile in self._tiles for c in tile.get_position()),
+                dtype=np.int64,
+                count=5 * len(self._tiles),
+            ).reshape(-1, 5)
+            shapes = np.array(
+                [(1,) * (5 - len(tile.shape)) + tile.shape for tile in self._tiles],
+                dtype=np.int64,
+            )
+            self._shape = tuple((positions + shapes).max(axis=0))
 
         return self._shape
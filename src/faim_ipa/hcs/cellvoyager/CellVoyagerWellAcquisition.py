@@ -42,8 +42,8 @@ class CellVoyagerWellAcquisition(WellAcquisition):
 
     def _compute_z_spacing(self, files: pd.DataFrame) -> Optional[float]:
         if "ZIndex" in files.columns:
-            z_steps = np.array(
-                files.astype({"Z": float}).groupby("ZIndex", sort=True).mean("Z")["Z"]
+            z_steps = (
+                files["Z"].astype(float).groupby(files["ZIndex"]).mean().to_numpy()
             )
 
             precision = -Decimal(str(z_steps[0])).as_tuple().exponent
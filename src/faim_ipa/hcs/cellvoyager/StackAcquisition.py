@@ -1,3 +1,4 @@
+from collections import defaultdict
 from os.path import exists, join
 from pathlib import Path
 import re
@@ -21,6 +22,8 @@ BTS_NS = "{http://www.yokogawa.co.jp/BTS/BTSSchema/1.0}"
 
 
 class StackAcquisition(PlateAcquisition):
+    _metadata: Optional[pd.DataFrame] = None
+
     def __init__(
         self,
         acquisition_dir: Union[Path, str],
@@ -66,10 +69,10 @@ class StackAcquisition(PlateAcquisition):
 
     def _build_well_acquisitions(self, files: pd.DataFrame) -> list[WellAcquisition]:
         wells = []
-        for well in tqdm(files["well"].unique()):
+        for _, well_files in tqdm(files.groupby("well", sort=False)):
             wells.append(
                 CellVoyagerWellAcquisition(
-                    files=files[files["well"] == well],
+                    files=well_files,
                     alignment=self._alignment,
                     metadata=self._parse_metadata(),
                     background_correction_matrices=self._background_correction_matrices,
@@ -87,6 +90,8 @@ class StackAcquisition(PlateAcquisition):
             return 0
 
     def _parse_metadata(self) -> pd.DataFrame:
+        if self._metadata is not None:
+            return self._metadata
         mrf_file = join(self._acquisition_dir, "MeasurementDetail.mrf")
         if not exists(mrf_file):
             raise ValueError(
@@ -120,12 +125,13 @@ class StackAcquisition(PlateAcquisition):
             }
             channel_settings.append(row)
 
-        return pd.merge(
+        self._metadata = pd.merge(
             pd.DataFrame(channels),
             pd.DataFrame(channel_settings),
             left_on="Ch",
             right_on="Ch",
         )
+        return self._metadata
 
     def _parse_files(self) -> pd.DataFrame:
         mlf_file = join(self._acquisition_dir, "MeasurementData.mlf")
@@ -133,23 +139,21 @@ class StackAcquisition(PlateAcquisition):
             raise ValueError(
                 f"MeasurementData.mlf not found in: {self._acquisition_dir}"
             )
-        mlf_tree = ET.parse(mlf_file)
-        mlf_root = mlf_tree.getroot()
-
-        files = []
-        for record in mlf_root.findall(BTS_NS + "MeasurementRecord"):
-            row = {
-                key.replace(BTS_NS, ""): value for key, value in record.attrib.items()
-            }
-            if row.pop("Type") == "IMG":
-                row |= {
-                    "path": join(self._acquisition_dir, record.text),
-                    "well": chr(ord("@") + int(row.pop("Row")))
-                    + row.pop("Column").zfill(2),
-                }
-                files.append(row)
-
-        files = pd.DataFrame(files)
+        columns = defaultdict(list)
+        for _, record in ET.iterparse(mlf_file, events=("end",)):
+            if record.tag != BTS_NS + "MeasurementRecord":
+                continue
+            if record.attrib[BTS_NS + "Type"] == "IMG":
+                for key, value in record.attrib.items():
+                    if key != BTS_NS + "Type":
+                        columns[key.replace(BTS_NS, "")].append(value)
+                columns["path"].append(join(self._acquisition_dir, record.text))
+            record.clear()
+
+        files = pd.DataFrame(columns)
+        files["well"] = files.pop("Row").astype(int).add(ord("@")).map(chr) + files.pop(
+            "Column"
+        ).str.zfill(2)
         files["TimePoint"] = files["TimePoint"].astype(int)
         files["ZIndex"] = files["ZIndex"].astype(int)
         return files
@@ -29,6 +29,9 @@ class StackedTile(Tile):
         self._paths = paths
         self._dtype = dtype
 
+    def get_dtype(self) -> np.dtype:
+        return self._dtype
+
     def load_data(self):
         data = np.zeros(self.shape, dtype=self._dtype)
         for i, path in enumerate(self._paths):
@@ -1,6 +1,8 @@
 import os
 import re
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Optional, Union
 
@@ -43,13 +45,17 @@ class ImageXpressPlateAcquisition(PlateAcquisition):
         DataFrame
             Table of all files in the acquisition.
         """
-        return pd.DataFrame(
-            ImageXpressPlateAcquisition._list_and_match_files(
-                root_dir=self._acquisition_dir,
-                root_re=self._get_root_re(),
-                filename_re=self._get_filename_re(),
-            )
+        files = ImageXpressPlateAcquisition._list_and_match_files(
+            root_dir=self._acquisition_dir,
+            root_re=self._get_root_re(),
+            filename_re=self._get_filename_re(),
         )
+        if not files:
+            return pd.DataFrame()
+        # The regex group dicts make every row share the same keys, so the
+        # DataFrame can be built column-wise without per-row dtype inference.
+        columns = {key: [row[key] for row in files] for key in files[0]}
+        return pd.DataFrame(columns)
 
     @staticmethod
     def _list_and_match_files(
@@ -57,20 +63,63 @@ class ImageXpressPlateAcquisition(PlateAcquisition):
         root_re: re.Pattern,
         filename_re: re.Pattern,
     ) -> list[list[dict[dict, str]]]:
+        files, sub_dirs = ImageXpressPlateAcquisition._scan_dir(
+            root=str(root_dir), root_re=root_re, filename_re=filename_re
+        )
+        walk_subtree = partial(
+            ImageXpressPlateAcquisition._walk_subtree,
+            root_re=root_re,
+            filename_re=filename_re,
+        )
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for rows in executor.map(walk_subtree, sub_dirs):
+                files.extend(rows)
+        return files
+
+    @staticmethod
+    def _walk_subtree(
+        root: str,
+        root_re: re.Pattern,
+        filename_re: re.Pattern,
+    ) -> list[dict[dict, str]]:
         files = []
-        for root, _, filenames in os.walk(root_dir):
-            m_root = root_re.fullmatch(root)
-            if m_root:
-                for f in filenames:
-                    m_filename = filename_re.fullmatch(f)
+        stack = [root]
+        while stack:
+            rows, sub_dirs = ImageXpressPlateAcquisition._scan_dir(
+                root=stack.pop(), root_re=root_re, filename_re=filename_re
+            )
+            files.extend(rows)
+            stack.extend(reversed(sub_dirs))
+        return files
+
+    @staticmethod
+    def _scan_dir(
+        root: str,
+        root_re: re.Pattern,
+        filename_re: re.Pattern,
+    ) -> tuple[list[dict[dict, str]], list[str]]:
+        """Match files directly inside root and collect sub-directories."""
+        m_root = root_re.match(root)
+        root_row = m_root.groupdict() if m_root else None
+        rows = []
+        sub_dirs = []
+        try:
+            entries = os.scandir(root)
+        except OSError:
+            return rows, sub_dirs
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    sub_dirs.append(entry.path)
+                elif root_row is not None:
+                    m_filename = filename_re.match(entry.name)
                     if m_filename:
-                        row = m_root.groupdict()
-                        row |= m_filename.groupdict()
+                        row = root_row | m_filename.groupdict()
                         if "channel" not in row or row["channel"] is None:
                             row["channel"] = "w1"
-                        row["path"] = str(Path(root).joinpath(f))
-                        files.append(row)
-        return files
+                        row["path"] = entry.path
+                        rows.append(row)
+        return rows, sub_dirs
 
     @abstractmethod
     def _get_root_re(self) -> re.Pattern:
@@ -84,10 +133,10 @@ class ImageXpressPlateAcquisition(PlateAcquisition):
 
     def _build_well_acquisitions(self, files: pd.DataFrame) -> list[WellAcquisition]:
         wells = []
-        for well in tqdm(files["well"].unique()):
+        for _, well_files in tqdm(files.groupby("well", sort=False)):
             wells.append(
                 ImageXpressWellAcquisition(
-                    files=files[files["well"] == well],
+                    files=well_files,
                     alignment=self._alignment,
                     z_spacing=self._get_z_spacing(),
                     background_correction_matrices=self._background_correction_matrices,
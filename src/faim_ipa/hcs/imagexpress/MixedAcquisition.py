@@ -40,6 +40,13 @@ class MixedAcquisition(StackAcquisition):
     The *_thumb*.tif files, used by Molecular Devices as preview, are ignored.
     """
 
+    _ROOT_RE = re.compile(
+        r".*[\/\\](?P<date>\d{4}-\d{2}-\d{2})[\/\\](?P<acq_id>\d+)(?:[\/\\]TimePoint_(?P<t>\d+))?(?:[\/\\]ZStep_(?P<z>\d+))?.*$"
+    )
+    _FILENAME_RE = re.compile(
+        r"(?P<name>.*)_(?P<well>[A-Z]+\d{2})_?(?P<field>s\d+)?_?(?P<channel>w[1-9])?(?!_thumb)(?P<md_id>[0-9A-F]{8}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{12})(?P<ext>.tif)$"
+    )
+
     def __init__(
         self,
         acquisition_dir: Union[Path, str],
@@ -75,11 +82,7 @@ class MixedAcquisition(StackAcquisition):
         return _files
 
     def _get_root_re(self) -> re.Pattern:
-        return re.compile(
-            r".*[\/\\](?P<date>\d{4}-\d{2}-\d{2})[\/\\](?P<acq_id>\d+)(?:[\/\\]TimePoint_(?P<t>\d+))?(?:[\/\\]ZStep_(?P<z>\d+))?.*"
-        )
+        return self._ROOT_RE
 
     def _get_filename_re(self) -> re.Pattern:
-        return re.compile(
-            r"(?P<name>.*)_(?P<well>[A-Z]+\d{2})_?(?P<field>s\d+)?_?(?P<channel>w[1-9]{1})?(?!_thumb)(?P<md_id>[0-9A-F]{8}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{12})(?P<ext>.tif)"
-        )
+        return self._FILENAME_RE
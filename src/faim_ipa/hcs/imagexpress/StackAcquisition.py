@@ -1,4 +1,6 @@
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 from pathlib import Path
 from typing import Optional, Union
@@ -39,6 +41,13 @@ class StackAcquisition(ImageXpressPlateAcquisition):
 
     _z_spacing: float = None
 
+    _ROOT_RE = re.compile(
+        r".*[\/\\](?P<date>\d{4}-\d{2}-\d{2})[\/\\](?P<acq_id>\d+)(?:[\/\\]TimePoint_(?P<t>\d+))?(?:[\/\\]ZStep_(?P<z>\d+))$"
+    )
+    _FILENAME_RE = re.compile(
+        r"(?P<name>.*)_(?P<well>[A-Z]+\d{2})_?(?P<field>s\d+)?_?(?P<channel>w[1-9])?(?!_thumb)(?P<md_id>[0-9A-F]{8}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{12})(?P<ext>.tif)$"
+    )
+
     def __init__(
         self,
         acquisition_dir: Union[Path, str],
@@ -59,14 +68,10 @@ class StackAcquisition(ImageXpressPlateAcquisition):
         return files
 
     def _get_root_re(self) -> re.Pattern:
-        return re.compile(
-            r".*[\/\\](?P<date>\d{4}-\d{2}-\d{2})[\/\\](?P<acq_id>\d+)(?:[\/\\]TimePoint_(?P<t>\d+))?(?:[\/\\]ZStep_(?P<z>\d+))"
-        )
+        return self._ROOT_RE
 
     def _get_filename_re(self) -> re.Pattern:
-        return re.compile(
-            r"(?P<name>.*)_(?P<well>[A-Z]+\d{2})_?(?P<field>s\d+)?_?(?P<channel>w[1-9]{1})?(?!_thumb)(?P<md_id>[0-9A-F]{8}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{4}-[0-9A-F]{12})(?P<ext>.tif)"
-        )
+        return self._FILENAME_RE
 
     def _get_z_spacing(self) -> Optional[float]:
         return self._z_spacing
@@ -80,16 +85,17 @@ class StackAcquisition(ImageXpressPlateAcquisition):
         if first_field is not None:
             subset = subset[subset["field"] == np.sort(subset["field"].unique())[0]]
 
-        plane_positions = []
-
-        for i, row in subset.iterrows():
-            file = row["path"]
-            if "z" in row.keys() and row["z"] is not None:
-                metadata = load_metaseries_tiff_metadata(file)
-                z_position = metadata["stage-position-z"]
-                plane_positions.append(z_position)
-
-        plane_positions = np.array(sorted(plane_positions), dtype=np.float32)
+        subset = subset[subset["z"].notna()]
+        with ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) * 4)
+        ) as executor:
+            metadatas = executor.map(load_metaseries_tiff_metadata, subset["path"])
+        plane_positions = np.sort(
+            np.array(
+                [metadata["stage-position-z"] for metadata in metadatas],
+                dtype=np.float32,
+            )
+        )
 
         precision = -Decimal(str(plane_positions[0])).as_tuple().exponent
         z_step = np.round(np.mean(np.diff(plane_positions)), decimals=precision)
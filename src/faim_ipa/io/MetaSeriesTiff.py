@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 
 from numpy._typing import ArrayLike
@@ -38,6 +39,11 @@ def load_metaseries_tiff_metadata(path: Path) -> dict:
     :return:
     image_data, metadata-dict
     """
+    return dict(_load_metaseries_tiff_metadata(str(path)))
+
+
+@lru_cache(maxsize=4096)
+def _load_metaseries_tiff_metadata(path: str) -> dict:
     with tifffile.TiffFile(path) as tiff:
         assert tiff.is_metaseries, f"{path} is not a metamorph file."
         selected_keys = [
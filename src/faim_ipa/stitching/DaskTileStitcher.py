@@ -72,24 +72,39 @@ class DaskTileStitcher:
     def _compute_block_to_tile_map(self):
         """
         Compute a map from block position to tiles that overlap with the block.
+
+        Blocks without overlapping tiles are omitted, which keeps the map
+        small when it is serialized into every dask task.
         """
         tiles_lut = self._build_tiles_lut()
+        bboxes_lut = {
+            pos: [
+                (
+                    tile,
+                    BoundingBox5D.from_pos_and_shape(
+                        position=tile.get_position(),
+                        shape=(1,) * (5 - len(tile.shape)) + tile.shape,
+                    ),
+                )
+                for tile in tiles
+            ]
+            for pos, tiles in tiles_lut.items()
+        }
         block_to_tile_map = {}
         for block_position in np.ndindex(self._n_chunks):
-            block_to_tile_map[block_position] = []
             block_bbox = BoundingBox5D.from_pos_and_shape(
                 position=tuple(block_position * np.array(self.chunk_shape)),
                 shape=self.chunk_shape,
             )
             pos = (block_bbox.time_start, block_bbox.channel_start, block_bbox.z_start)
-            if pos in tiles_lut.keys():
-                for tile in tiles_lut[pos]:
-                    tile_bbox = BoundingBox5D.from_pos_and_shape(
-                        position=tile.get_position(),
-                        shape=(1,) * (5 - len(tile.shape)) + tile.shape,
-                    )
-                    if block_bbox.overlaps(tile_bbox):
-                        block_to_tile_map[block_position].append(tile)
+            if pos in bboxes_lut.keys():
+                block_tiles = [
+                    tile
+                    for tile, tile_bbox in bboxes_lut[pos]
+                    if block_bbox.overlaps(tile_bbox)
+                ]
+                if block_tiles:
+                    block_to_tile_map[block_position] = block_tiles
 
         return block_to_tile_map
 
@@ -1,10 +1,21 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Union
 
 import numpy as np
 from numpy._typing import NDArray
 from pydantic import BaseModel, NonNegativeInt
-from tifffile import imread
+from tifffile import TiffFile, imread
+
+
+@lru_cache(maxsize=32)
+def _load_correction_matrix(path: str) -> NDArray:
+    """Load a background/illumination correction matrix.
+
+    The same few matrices (one per channel) are applied to every tile,
+    so they are kept in a small cache instead of being re-read per tile.
+    """
+    return imread(path)
 
 
 class TilePosition(BaseModel):
@@ -71,6 +82,17 @@ class Tile:
             self.position.x,
         )
 
+    def get_dtype(self) -> np.dtype:
+        """
+        Read the data type from the TIFF header, without loading pixel data.
+
+        Returns
+        -------
+        Image data type
+        """
+        with TiffFile(self.path) as tiff:
+            return tiff.series[0].dtype
+
     def load_data(self) -> NDArray:
         """
         Load the image data from the path.
@@ -98,7 +120,7 @@ class Tile:
     def _apply_illumination_correction(self, data):
         dtype = data.dtype
         if self.illumination_correction_matrix_path is not None:
-            icm = imread(self.illumination_correction_matrix_path)
+            icm = _load_correction_matrix(str(self.illumination_correction_matrix_path))
             assert icm.shape == data.shape, (
                 f"Illumination correction matrix shape {icm.shape} "
                 f"does not match image shape {data.shape}."
@@ -110,7 +132,7 @@ class Tile:
     def _apply_background_correction(self, data):
         dtype = data.dtype
         if self.background_correction_matrix_path is not None:
-            bgcm = imread(self.background_correction_matrix_path)
+            bgcm = _load_correction_matrix(str(self.background_correction_matrix_path))
             assert bgcm.shape == data.shape, (
                 f"Background correction matrix shape {bgcm.shape} "
                 f"does not match image shape {data.shape}."
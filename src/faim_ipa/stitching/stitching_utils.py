@@ -1,5 +1,3 @@
-from copy import copy
-
 import numpy as np
 from numpy._typing import NDArray
 from scipy.ndimage import distance_transform_edt
@@ -33,18 +31,17 @@ def fuse_linear(warped_tiles: NDArray, warped_masks: NDArray) -> NDArray:
             )
 
         denominator = weights.sum(axis=0)
-        weights = np.true_divide(weights, denominator, where=denominator > 0)
-        weights = np.nan_to_num(weights, nan=0, posinf=1, neginf=0)
-        weights = np.clip(
-            weights,
-            0,
-            1,
-        )
+        np.true_divide(weights, denominator, out=weights, where=denominator > 0)
+        np.nan_to_num(weights, copy=False, nan=0, posinf=1, neginf=0)
+        np.clip(weights, 0, 1, out=weights)
         weights = weights[:, np.newaxis, ...]
     else:
         weights = warped_masks
 
-    return np.sum(warped_tiles * weights, axis=0).astype(dtype)
+    weighted_tiles = np.multiply(
+        warped_tiles, weights, out=np.empty(warped_tiles.shape, dtype=np.float32)
+    )
+    return weighted_tiles.sum(axis=0).astype(dtype)
 
 
 def fuse_mean(warped_tiles: NDArray, warped_masks: NDArray) -> NDArray:
@@ -62,17 +59,20 @@ def fuse_mean(warped_tiles: NDArray, warped_masks: NDArray) -> NDArray:
     -------
     Fused image.
     """
-    warped_masks = warped_masks[:, 0]
-    denominator = warped_masks.sum(axis=0)
-    weights = np.true_divide(warped_masks, denominator, where=denominator > 0)
-    weights = np.clip(
-        np.nan_to_num(weights, nan=0, posinf=1, neginf=0),
-        0,
-        1,
-    )
-    weights = weights[:, np.newaxis, ...]
+    if warped_tiles.shape[0] == 1:
+        return warped_tiles[0]
 
-    fused_image = np.sum(warped_tiles * weights, axis=0)
+    warped_masks = warped_masks[:, 0]
+    counts = warped_masks.sum(axis=0, dtype=np.uint8)
+    where = warped_masks[:, np.newaxis, ...]
+    if warped_tiles.dtype == np.uint16 and warped_tiles.shape[0] <= 8:
+        # Integer SIMD path: a uint32 accumulator cannot overflow for up
+        # to 8 uint16 tiles and floor-divides exactly like the float path.
+        fused_image = np.sum(warped_tiles, axis=0, where=where, dtype=np.uint32)
+        fused_image //= np.maximum(counts, 1)
+        return fused_image.astype(warped_tiles.dtype)
+    fused_image = np.sum(warped_tiles, axis=0, where=where, dtype=np.float64)
+    fused_image /= np.maximum(counts, 1)
     return fused_image.astype(warped_tiles.dtype)
 
 
@@ -91,8 +91,14 @@ def fuse_sum(warped_tiles: NDArray, warped_masks: NDArray) -> NDArray:
     -------
     Fused image.
     """
-    fused_image = np.sum(warped_tiles, axis=0)
-    return fused_image.astype(warped_tiles.dtype)
+    dtype = warped_tiles.dtype
+    if np.issubdtype(dtype, np.integer):
+        # Accumulate in a wide integer dtype and clip, so that summing
+        # overlapping tiles saturates instead of wrapping around.
+        acc = np.add.reduce(warped_tiles, axis=0, dtype=np.int64)
+        np.clip(acc, np.iinfo(dtype).min, np.iinfo(dtype).max, out=acc)
+        return acc.astype(dtype)
+    return np.add.reduce(warped_tiles, axis=0, dtype=dtype)
 
 
 def translate_tiles_2d(
@@ -115,33 +121,49 @@ def translate_tiles_2d(
         translated tiles, translated masks
     """
     array_location = block_info[None]["array-location"]
-    chunk_zyx_origin = np.array(
-        [array_location[2][0], array_location[3][0], array_location[4][0]]
-    )
-    warped_tiles = []
-    warped_masks = []
-    for tile in tiles:
-        tile_origin = np.array(tile.get_zyx_position())
+    chunk_y_origin = array_location[3][0]
+    chunk_x_origin = array_location[4][0]
+    stack_shape = (len(tiles), *chunk_shape)
+    warped_tiles = None
+    warped_masks = np.zeros(stack_shape, dtype=bool)
+    for i, tile in enumerate(tiles):
+        _, tile_y, tile_x = tile.get_zyx_position()
         if build_acquisition_mask:
             tile_data = tile.load_data_mask()
         else:
             tile_data = tile.load_data()
         if tile_data.ndim == 2:
             tile_data = tile_data[np.newaxis, ...]
-        warped_mask, warped_tile = shift_yx(
-            chunk_zyx_origin, tile_data, tile_origin, chunk_shape
+        if warped_tiles is None:
+            warped_tiles = np.zeros(stack_shape, dtype=tile_data.dtype)
+        _shift_yx_into(
+            tile_data,
+            (tile_y - chunk_y_origin, tile_x - chunk_x_origin),
+            warped_tiles[i],
+            warped_masks[i],
         )
 
-        warped_tiles.append(warped_tile)
-        warped_masks.append(warped_mask)
-
-    return np.array(warped_tiles), np.array(warped_masks)
+    return warped_tiles, warped_masks
 
 
 def shift_yx(chunk_zyx_origin, tile_data, tile_origin, chunk_shape):
     warped_tile = np.zeros(chunk_shape, dtype=tile_data.dtype)
     warped_mask = np.zeros(chunk_shape, dtype=bool)
-    yx_shift = (tile_origin - chunk_zyx_origin)[1:]
+    _shift_yx_into(
+        tile_data,
+        (
+            int(tile_origin[1] - chunk_zyx_origin[1]),
+            int(tile_origin[2] - chunk_zyx_origin[2]),
+        ),
+        warped_tile,
+        warped_mask,
+    )
+    return warped_mask, warped_tile
+
+
+def _shift_yx_into(tile_data, yx_shift, warped_tile, warped_mask):
+    """Paste the overlap of tile_data into the pre-allocated chunk buffers."""
+    chunk_shape = warped_tile.shape
     if yx_shift[0] < 0:
         tile_start_y = abs(yx_shift[0])
         tile_end_y = min(tile_start_y + chunk_shape[1], tile_data.shape[1])
@@ -166,7 +188,6 @@ def shift_yx(chunk_zyx_origin, tile_data, tile_origin, chunk_shape):
         end_x = start_x + tile_data.shape[2]
         warped_tile[: tile_data.shape[0], start_y:end_y, start_x:end_x] = tile_data
         warped_mask[: tile_data.shape[0], start_y:end_y, start_x:end_x] = True
-    return warped_mask, warped_tile
 
 
 def assemble_chunk(
@@ -199,7 +220,7 @@ def assemble_chunk(
     """
     chunk_location = block_info[None]["chunk-location"]
     chunk_shape = block_info[None]["chunk-shape"]
-    tiles = tile_map[chunk_location]
+    tiles = tile_map.get(chunk_location, [])
 
     if len(tiles) > 0:
         warped_tiles, warped_masks = warp_func(
@@ -215,7 +236,8 @@ def assemble_chunk(
         else:
             stitched_img = warped_tiles[np.newaxis, ...]
     else:
-        stitched_img = np.zeros(chunk_shape, dtype=dtype)
+        # Read-only all-zero view; avoids materializing empty chunks.
+        stitched_img = np.broadcast_to(np.zeros((), dtype=dtype), chunk_shape)
 
     return stitched_img
 
@@ -224,6 +246,9 @@ def shift_to_origin(tiles: list[Tile]) -> list[Tile]:
     """
     Shift tile positions such that the minimal position is (0, 0, 0, 0, 0).
 
+    Note: Tile positions are updated in place and the input list is
+    returned.
+
     Parameters
     ----------
     tiles :
@@ -233,15 +258,12 @@ def shift_to_origin(tiles: list[Tile]) -> list[Tile]:
     -------
     List of shifted tiles.
     """
-    min_tile_origin = np.min([np.array(tile.get_position()) for tile in tiles], axis=0)
-    shifted_tiles = copy(tiles)
-    for tile in shifted_tiles:
-        shifted_pos = np.array(tile.get_position()) - min_tile_origin
-        tile.position = TilePosition(
-            time=shifted_pos[0],
-            channel=shifted_pos[1],
-            z=shifted_pos[2],
-            y=shifted_pos[3],
-            x=shifted_pos[4],
-        )
-    return shifted_tiles
+    positions = np.fromiter(
+        (c for tile in tiles for c in tile.get_position()),
+        dtype=np.int64,
+        count=5 * len(tiles),
+    ).reshape(-1, 5)
+    shifted_positions = (positions - positions.min(axis=0)).tolist()
+    for tile, (time, channel, z, y, x) in zip(tiles, shifted_positions):
+        tile.position = TilePosition(time=time, channel=channel, z=z, y=y, x=x)
+    return tiles
@@ -144,4 +144,5 @@ def test_raise_value_errors(cv_acquisition):
         )
         # Change acquisition_dir to mock missing mrf and mes files.
         plate._acquisition_dir = "."
+        plate._metadata = None
         plate._parse_metadata()
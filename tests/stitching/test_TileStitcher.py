@@ -94,7 +94,8 @@ def test_block_to_tile_map_with_missing_tiles(tiles):
     )
 
     assert ts._shape == (1, 1, 2, 20, 20)
-    assert len(ts._block_to_tile_map) == 8
+    # Blocks without tiles are not stored in the map.
+    assert len(ts._block_to_tile_map) == 4
     assert ts._block_to_tile_map[(0, 0, 0, 0, 0)] == [
         tiles[0],
         tiles[1],
@@ -104,10 +105,10 @@ def test_block_to_tile_map_with_missing_tiles(tiles):
     assert ts._block_to_tile_map[(0, 0, 0, 0, 1)] == [tiles[1], tiles[3]]
     assert ts._block_to_tile_map[(0, 0, 0, 1, 0)] == [tiles[2], tiles[3]]
     assert ts._block_to_tile_map[(0, 0, 0, 1, 1)] == [tiles[3]]
-    assert ts._block_to_tile_map[(0, 0, 1, 0, 0)] == []
-    assert ts._block_to_tile_map[(0, 0, 1, 0, 1)] == []
-    assert ts._block_to_tile_map[(0, 0, 1, 1, 0)] == []
-    assert ts._block_to_tile_map[(0, 0, 1, 1, 1)] == []
+    assert (0, 0, 1, 0, 0) not in ts._block_to_tile_map
+    assert (0, 0, 1, 0, 1) not in ts._block_to_tile_map
+    assert (0, 0, 1, 1, 0) not in ts._block_to_tile_map
+    assert (0, 0, 1, 1, 1) not in ts._block_to_tile_map
 
 
 def test_block_to_tile_map_small_chunks(tiles):
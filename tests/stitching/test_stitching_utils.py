@@ -53,6 +53,18 @@ def test_fuse_sum(tiles, masks):
     assert_array_equal(fused_result[:, :, 15:], 4)
 
 
+def test_fuse_sum_saturates(masks):
+    bright_tiles = np.full((2, 1, 10, 20), 40000, dtype=np.uint16)
+    fused_result = fuse_sum(warped_tiles=bright_tiles, warped_masks=masks)
+    assert fused_result.dtype == np.uint16
+    assert_array_equal(fused_result, 65535)
+
+    float_tiles = bright_tiles.astype(np.float32)
+    fused_result = fuse_sum(warped_tiles=float_tiles, warped_masks=masks)
+    assert fused_result.dtype == np.float32
+    assert_array_equal(fused_result, 80000.0)
+
+
 def test_fuse_linear(tiles, masks):
     fused_result = fuse_linear(warped_tiles=tiles, warped_masks=masks)
     assert fused_result.shape == (1, 10, 20)